@@ -122,6 +122,10 @@ class AbstractCItem(object):
     #:  :class:`HxCType` they handle.
     TYPE_HANDLE = -1
 
+    #: No ``__dict__`` for the nodes: there can be a lot of them in a
+    #:  function, child classes should also define ``__slots__``.
+    __slots__ = ("_citem",)
+
     def __init__(self, citem):
         """
             Constructor for the abstract class :class:`HxCItem` . This should
@@ -235,6 +239,17 @@ class AbstractCItem(object):
         """
         raise NotImplementedError("_create_child is an abstract method and should be surcharge by child class")
 
+    def _create_children(self, citems):
+        """
+            Abstract method which allow to create a list of child elements
+            for this object with the correct class. This is equivalent to
+            call :meth:`~AbstractCItem._create_child` on each element but
+            allows the child classes to provide a faster implementation. This
+            should be implemented by child classes and will raise a
+            :class:`NotImplementedError` exception if not surcharge.
+        """
+        raise NotImplementedError("_create_children is an abstract method and should be surcharge by child class")
+
     ############################ CLASS METHODS ##########################
 
     @classmethod
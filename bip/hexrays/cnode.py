@@ -4,6 +4,7 @@
     :class:`HxCItem` equivalent.
 """
 import idc
+import warnings
 from .astnode import AbstractCItem, HxCType
 from .hx_citem import HxCItem, HxCExpr, HxCStmt
 from bip.base.biptype import BipType
@@ -12,8 +13,45 @@ from . import cnode_visitor
 
 import ida_pro
 import ida_lines
+from bip.py3compat.py3compat import with_metaclass
 
-class CNode(AbstractCItem):
+#: Sentinel value used by :class:`CNode` for indicating the
+#:  :meth:`~CNode.closest_ea` has not been computed yet (``None`` is a valid
+#:  result for this property).
+_CLOSEST_UNSET = object()
+
+#: Dictionary which allows to add method to a particular CNode
+#:  implementation. This is used by :func:`addCNodeMethod` for adding a method
+#:  in a CNode class which does not exist (is not possible to implement) in
+#:  the HxCItem class equivalent. When the class is created (by
+#:  :class:`_CNodeMeta`) the method will be added. Most of the CNode classes
+#:  are created by :func:`buildCNode` only when the ``hx_cexpr`` and
+#:  ``hx_cstmt`` modules are loaded, after the methods at the end of this
+#:  module have been registered.
+#:
+#:  This dictionary as the name of the class for key, and a parameter a list
+#:  of tuples. Each tuple consist of the name of the method as first element
+#:  follow by the function object.
+_cnodeMethods = {}
+
+class _CNodeMeta(type):
+    """
+        Metaclass of :class:`CNode` and all its subclasses. When a class is
+        created this will:
+
+        * define an empty ``__slots__`` if the class does not define one,
+          :class:`CNode` objects never have a ``__dict__``.
+        * add the methods registered for this class by
+          :func:`addCNodeMethod` in ``_cnodeMethods``.
+    """
+
+    def __new__(mcs, name, bases, ns):
+        ns.setdefault("__slots__", ())
+        for na, f in _cnodeMethods.get(name, ()):
+            ns[na] = f
+        return super(_CNodeMeta, mcs).__new__(mcs, name, bases, ns)
+
+class CNode(with_metaclass(_CNodeMeta, AbstractCItem)):
     """
         Abstract class which allow to represent C expression and C statement
         decompiled from HexRays. This is an equivalent class to
@@ -37,6 +75,8 @@ class CNode(AbstractCItem):
         of the correct subclass which inherit from :class:`CNode`.
     """
 
+    __slots__ = ("_hxcfunc", "_parent", "_closest_ea", "__weakref__")
+
     ############################# ITEM CREATION #############################
 
     def __init__(self, citem, hxcfunc, parent):
@@ -47,7 +87,10 @@ class CNode(AbstractCItem):
             :param citem: a ``citem_t`` object, in practice this should always
                 be a ``cexpr_t`` or a ``cinsn_t`` object.
             :param hxcfunc: A :class:`HxCFunc` object corresponding to the
-                function which contains this node/item.
+                function which contains this node/item. The node is
+                registered in its ``_wrap_cache`` (see
+                :meth:`CNode.from_citem`), any object given here must
+                provide it.
             :param parent: An object which inherit from :class:`CNode`
                 corresponding to the parent expression or statement of this
                 object. This may be ``None`` if this node is the root of
@@ -66,6 +109,13 @@ class CNode(AbstractCItem):
         #:  attribute will not make any modification to the data stored in
         #:  IDA.
         self._parent = parent
+        # only one CNode by citem_t, the function keeps only a weak
+        #   reference on it (see HxCFunc._wrap_cache)
+        hxcfunc._wrap_cache[citem.obj_id] = self
+        #: Cache for the :meth:`~CNode.closest_ea` property. This is
+        #:  ``_CLOSEST_UNSET`` as long as it has not been computed. This is
+        #:  private and should not be modify.
+        self._closest_ea = _CLOSEST_UNSET
 
     ################################## BASE #################################
 
@@ -80,18 +130,38 @@ class CNode(AbstractCItem):
             of this node (which should be the root node of the function) still
             has no address, ``None`` is return.
 
+            The result is cached in the node, and in all the parents visited
+            for computing it.
+
             :return: An integer corresponding to the closest address for this
                 node. If no address where found this method will return None.
         """
-        ea = self.ea
-        obj = self._parent
-        while ea == idc.BADADDR and obj is not None:
-            ea = obj.ea
+        unset = _CLOSEST_UNSET
+        if self._closest_ea is not unset:
+            return self._closest_ea
+        bad = idc.BADADDR
+        # climb the parents until an address is found, all the nodes visited
+        #   without address have the same closest_ea, keep them for setting
+        #   their cache. The attributes are accessed directly (not the
+        #   properties) as this may be called a lot.
+        visited = []
+        obj = self
+        ea = bad
+        while obj is not None:
+            if obj._closest_ea is not unset:
+                ea = obj._closest_ea
+                break
+            ea = obj._citem.ea
+            if ea != bad:
+                break
+            visited.append(obj)
             obj = obj._parent
-        if ea == idc.BADADDR:
-            return None
-        else:
-            return ea
+        if ea == bad:
+            ea = None
+        for obj in visited:
+            obj._closest_ea = ea
+        self._closest_ea = ea
+        return ea
 
     @property
     def cstr(self):
@@ -233,9 +303,11 @@ class CNode(AbstractCItem):
                 :meth:`~CNode.visit_cnode` for more information).
         """
         l = []
-        def _app_filt(cn):
-            if cb_filter(cn):
-                l.append(cn)
+        # the callback and the bound append are given as default arguments
+        #   for avoiding lookups at each node visited
+        def _app_filt(cn, _cb=cb_filter, _app=l.append):
+            if _cb(cn):
+                _app(cn)
         self.visit_cnode(_app_filt)
         return l
 
@@ -253,12 +325,90 @@ class CNode(AbstractCItem):
             :return: A list of :class:`CNode` which have match the type.
                 This list is order in which the node have been visited (see
                 :meth:`~HxCFunc.visit_cnode` for more information).
+
+            .. note:: The result is cached in the :class:`HxCFunc` of this
+                node, calling this method several times with the same filter
+                will not visit the AST again. The cache is cleared by
+                :meth:`HxCFunc.invalidate_cache`.
         """
-        l = []
-        def _app_filt(cn):
-            l.append(cn)
-        self.visit_cnode_filterlist(_app_filt, type_filter)
-        return l
+        # the result is cached in the HxCFunc: the key is the node from
+        #   which the search start (obj_id is the address of the citem_t in
+        #   memory, stable as long as the cfunc_t exist) and the filter. List
+        #   and tuple do not have the same meaning for the visitor (see
+        #   visit_dfs_cnode_filterlist) so this is part of the key.
+        if isinstance(type_filter, (list, tuple)):
+            tf_key = frozenset(type_filter)
+        else:
+            tf_key = frozenset((type_filter,))
+        key = (self._citem.obj_id, isinstance(type_filter, list), tf_key)
+        cache = self._hxcfunc._filter_cache
+        if key in cache:
+            return list(cache[key])
+        # use the arrays of the function if they were built
+        l = self._hxcfunc._soa_filter_type(self, type_filter)
+        if l is None:
+            l = []
+            # no need for a wrapper, the bound append is the callback
+            self.visit_cnode_filterlist(l.append, type_filter)
+        cache[key] = l
+        return list(l)
+
+    def multi_filter(self, buckets):
+        """
+            Method which allow to get several lists of :class:`CNode` of
+            particular types in only one visit of the nodes below (and
+            including) this one. This is equivalent to calling
+            :meth:`~CNode.get_cnode_filter_type` for each filter but the AST
+            is visited only once, this should be prefered when several
+            types of nodes are needed.
+
+            .. code-block:: python
+
+                # cn is a CNode
+                d = cn.multi_filter({
+                        "calls": [CNodeExprCall],
+                        "vars": [CNodeExprVar],
+                    })
+                # d["calls"] is the list of CNodeExprCall below cn,
+                #   d["vars"] the list of CNodeExprVar.
+
+            :param buckets: A dictionary with the name of the result as key
+                and the filter as value. Filters are the same as for
+                :meth:`~CNode.get_cnode_filter_type`: a class or a tuple of
+                classes for matching the classes and their child classes, a
+                list of classes for matching only those classes.
+            :return: A dictionary with the same keys as ``buckets`` and as
+                value the list of :class:`CNode` matching the filter, in the
+                order in which the nodes have been visited.
+        """
+        out = {}
+        # for the filters using only CNode classes: class to the bound
+        #   append methods of the results in which a node of this class
+        #   should be added.
+        by_cls = {}
+        # for the others: list of tuples (filter as tuple, is a list,
+        #   bound append of the results).
+        others = []
+        for name, type_filter in buckets.items():
+            l = []
+            out[name] = l
+            expanded = _expand_filter(type_filter)
+            if expanded is not None:
+                for cl in expanded:
+                    by_cls.setdefault(cl, []).append(l.append)
+            elif isinstance(type_filter, (list, tuple)):
+                others.append((tuple(type_filter), isinstance(type_filter, list), l.append))
+            else:
+                others.append(((type_filter, ), False, l.append))
+        def _dispatch(cn, _get=by_cls.get, _others=others):
+            cls = cn.__class__
+            for app in _get(cls, ()):
+                app(cn)
+            for flt, is_list, app in _others:
+                if (is_list and cls in flt) or (not is_list and isinstance(cn, flt)):
+                    app(cn)
+        self.visit_cnode(_dispatch)
+        return out
 
     ########################### HELPER FUNCTIONS ############################
 
@@ -307,6 +457,18 @@ class CNode(AbstractCItem):
         """
         return CNode.from_citem(citem, self._hxcfunc, self)
 
+    def _create_children(self, citems):
+        """
+            Internal method which allow to create a list of :class:`CNode`
+            objects from ``citem_t`` children of the current node. This is
+            the equivalent of calling :meth:`~CNode._create_child` on each
+            element but faster, see :func:`_wrap_children`.
+
+            :param citems: An iterable of ``citem_t`` from ida.
+            :return: A list of objects which inherit from :class:`CNode` .
+        """
+        return _wrap_children(citems, self._hxcfunc, self)
+
     @staticmethod
     def from_citem(citem, hxcfunc, parent):
         """
@@ -324,6 +486,9 @@ class CNode(AbstractCItem):
                 this function for creating child item but
                 :meth:`CNode._create_child`.
 
+            Only one :class:`CNode` is created for a ``citem_t`` in an
+            :class:`HxCFunc`: if it already exist the same object is returned.
+
             :param citem: A ``citem_t`` from ida.
             :param hxcfunc: A :class:`HxCFunc` object corresponding to the
                 function which contains this node/item.
@@ -334,18 +499,13 @@ class CNode(AbstractCItem):
             :return: The equivalent object to the ``citem_t`` for bip. This
                 will be an object which inherit from :class:`HxCItem` .
         """
-        done = set()
-        todo = set(CNode.__subclasses__())
-        while len(todo) != 0:
-            cl = todo.pop()
-            if cl in done:
-                continue
-            if cl.is_handling_type(citem.op):
-                return cl(citem, hxcfunc, parent)
-            else:
-                done.add(cl)
-                todo |= set(cl.__subclasses__())
-        raise ValueError("from_citem could not find an object matching the citem_t type provided ({})".format(citem.op))
+        cn = hxcfunc._wrap_cache.get(citem.obj_id)
+        if cn is not None:
+            return cn
+        cl = _op2cnode.get(citem.op)
+        if cl is None:
+            raise ValueError("from_citem could not find an object matching the citem_t type provided ({})".format(citem.op))
+        return cl(citem, hxcfunc, parent)
 
 class CNodeExpr(CNode):
     """
@@ -363,6 +523,8 @@ class CNodeExpr(CNode):
             duplication of the :class:`HxCExpr` class.
     """
 
+    __slots__ = ("_cexpr", "_ops_cache")
+
     def __init__(self, cexpr, hxcfunc, parent):
         """
             Constructor for the :class:`CNodeExpr` object. Arguments are
@@ -379,6 +541,9 @@ class CNodeExpr(CNode):
         super(CNodeExpr, self).__init__(cexpr, hxcfunc, parent)
         #: The ``cexpr_t`` object from ida.
         self._cexpr = cexpr
+        #: Cache for the list returned by :meth:`~CNodeExpr.ops`, ``None``
+        #:  if it was not computed yet. See :func:`buildCNode`.
+        self._ops_cache = None
 
     def __str__(self):
         """
@@ -446,8 +611,9 @@ class CNodeExpr(CNode):
             :return: A CNode object which is not of one of the class in
                 ``li``.
         """
+        skip = tuple(li)
         obj = self
-        while isinstance(obj, tuple(li)) and not isinstance(obj, CNodeExprFinal):
+        while not isinstance(obj, CNodeExprFinal) and isinstance(obj, skip):
             obj = obj.ops[0]
         return obj
 
@@ -469,6 +635,8 @@ class CNodeStmt(CNode):
         object will start with the prefix ``stmt_`` or ``st_``.
     """
 
+    __slots__ = ("_cinsn", "_stmt_children_cache", "_expr_children_cache")
+
     def __init__(self, cinsn, hxcfunc, parent):
         """
             Constructor for a :class:`CNodeStmt` object. Arguments are
@@ -485,6 +653,11 @@ class CNodeStmt(CNode):
         super(CNodeStmt, self).__init__(cinsn, hxcfunc, parent)
         #: The ``cinsn_t`` object from ida.
         self._cinsn = cinsn
+        #: Cache for the lists returned by :meth:`~CNodeStmt.stmt_children`
+        #:  and :meth:`~CNodeStmt.expr_children`, ``None`` if they were not
+        #:  computed yet. See :func:`buildCNode`.
+        self._stmt_children_cache = None
+        self._expr_children_cache = None
 
     def __str__(self):
         """
@@ -527,16 +700,104 @@ _citem2cnode = {
         HxCStmt: CNodeStmt,
     }
 
-#: Dictionary which allows to add method to a particular CNode
-#:  implementation. This is used by :func:`addCNodeMethod` for adding a method
-#:  in a CNode class which does not exist (is not possible to implement) in
-#:  the HxCItem class equivalent. When the object is created by
-#:  ``buildCNode`` the method will be added.
-#:
-#:  This dictionary as the name of the class for key, and a parameter a list
-#:  of tuples. Each tuple consist of the name of the method as first element
-#:  follow by the function object.
-_cnodeMethods = {}
+#: Dictionary which associate an :class:`HxCType` value (the ``op`` of a
+#:  ``citem_t``) to the class which inherit from :class:`CNode` and handle
+#:  it. This is used by :meth:`CNode.from_citem` for finding the class to
+#:  instantiate without having to look in all the subclasses of
+#:  :class:`CNode`. It is filled by :func:`buildCNode` each time a new class
+#:  is created and should not be modified by hand.
+_op2cnode = {}
+
+def _register_op2cnode(cn_cls):
+    """
+        Internal function which add the :class:`HxCType` values handled by
+        a class which inherit from :class:`CNode` in the ``_op2cnode``
+        dictionary. The types handled are determined using
+        :meth:`~AbstractCItem.is_handling_type`, abstract classes will not
+        add any entry.
+
+        :param cn_cls: A class which inherit from :class:`CNode`.
+    """
+    for op in range(HxCType.COT_EMPTY, HxCType.CIT_END):
+        if cn_cls.is_handling_type(op):
+            _op2cnode[op] = cn_cls
+
+def _wrap_children(citems, hxcfunc, parent, _tab=_op2cnode):
+    """
+        Internal function which create the :class:`CNode` objects for a list
+        of ``citem_t`` having the same parent. The lookups in
+        ``HxCFunc._wrap_cache`` (for an already existing :class:`CNode`) and
+        in ``_op2cnode`` are inlined, if a type is not present in it this
+        fallback on :meth:`CNode.from_citem`.
+
+        :param citems: An iterable of ``citem_t`` from ida.
+        :param hxcfunc: The :class:`HxCFunc` object containing the nodes.
+        :param parent: The :class:`CNode` parent of the nodes to create.
+        :return: A list of objects which inherit from :class:`CNode` .
+    """
+    w = hxcfunc._wrap_cache
+    res = []
+    for c in citems:
+        # explicit test against None: a CNode can be false (ex.: a
+        #   CNodeStmtAsm without instruction has a len of 0)
+        cn = w.get(c.obj_id)
+        if cn is None:
+            cl = _tab.get(c.op)
+            if cl is None:
+                cn = CNode.from_citem(c, hxcfunc, parent)
+            else:
+                cn = cl(c, hxcfunc, parent)
+        res.append(cn)
+    return res
+
+#: Cache for :func:`_expand_filter`, the key is a tuple of a boolean
+#:  indicating if the filter was a list and a frozenset of the classes of the
+#:  filter, the value is the result of :func:`_expand_filter`. This is emptied
+#:  by :func:`buildCNode` as the new class may be missing in it.
+_expanded_filters = {}
+
+def _expand_filter(filter_list):
+    """
+        Internal function which convert a filter of classes, as used by
+        :func:`~cnode_visitor.visit_dfs_cnode_filterlist`, in the set of
+        classes which will match it. This allows to test if a node match the
+        filter using ``type(node) in s`` instead of ``isinstance``.
+
+        If ``filter_list`` is a list, only the classes in it match (no
+        inheritance), in the other case (a tuple or a class) all the
+        classes which inherit from the classes of the filter match.
+
+        :param filter_list: A list or tuple of class or a class which inherit
+            from :class:`CNode`.
+        :return: A ``frozenset`` of the classes which inherit from
+            :class:`CNode` and match the filter, or ``None`` if one of the
+            element of the filter is not a subclass of :class:`CNode` (in that
+            case ``isinstance`` should be used).
+    """
+    is_list = isinstance(filter_list, list)
+    if isinstance(filter_list, (list, tuple)):
+        flt = frozenset(filter_list)
+    else:
+        flt = frozenset((filter_list, ))
+    key = (is_list, flt)
+    if key in _expanded_filters:
+        return _expanded_filters[key]
+    if not all(isinstance(cl, type) and issubclass(cl, CNode) for cl in flt):
+        res = None
+    elif is_list:
+        res = flt
+    else:
+        # the classes of the filter and all the classes which inherit
+        #   from them
+        res = set(flt)
+        todo = list(flt)
+        while todo:
+            subs = todo.pop().__subclasses__()
+            res.update(subs)
+            todo.extend(subs)
+        res = frozenset(res)
+    _expanded_filters[key] = res
+    return res
 
 def addCNodeMethod(cnode_name, func_name=None):
     """
@@ -548,7 +809,10 @@ def addCNodeMethod(cnode_name, func_name=None):
         added this way should be done before calling it. If the method already
         exist it will be overwrite by this implementation, this allow to
         redefine base methods from the HxCExpr.
-        Internally this use the ``_cnodeMethods`` global dictionary.
+        Internally this use the ``_cnodeMethods`` global dictionary, the
+        methods are added by the metaclass :class:`_CNodeMeta` when the
+        class is created. If the class was already created the method is
+        directly set on it and a warning is emitted.
 
         It is possible to add properties using this method, if no
         ``func_name`` parameter is provided the name of the getter will be
@@ -581,9 +845,6 @@ def addCNodeMethod(cnode_name, func_name=None):
             if None the name of the function will be used.
     """
     global _cnodeMethods
-    # check if the cnode is already present in the dict:
-    if cnode_name not in _cnodeMethods:
-        _cnodeMethods[cnode_name] = []
     # the real internal function decorator.
     def _internal_addcnodemeth(func):
         # select function name
@@ -594,13 +855,111 @@ def addCNodeMethod(cnode_name, func_name=None):
                 fn = func.fget.__name__
             else:
                 fn = func.__name__
-        # adding the method in the dict
-        _cnodeMethods[cnode_name].append((fn, func, ))
+        cn_cls = globals().get(cnode_name)
+        if isinstance(cn_cls, _CNodeMeta):
+            # class already created: too late for the metaclass
+            warnings.warn("addCNodeMethod: {} already created, {} is set directly on it".format(cnode_name, fn))
+            setattr(cn_cls, fn, func)
+        else:
+            # adding the method in the dict
+            _cnodeMethods.setdefault(cnode_name, []).append((fn, func, ))
         # we let the method be define without change
         return func
     return _internal_addcnodemeth
 
 
+#: Dictionary of the properties returning the children of a node for which
+#:  the result is cached in the :class:`CNode` object. The key is the name of
+#:  the property and the value the name of the attribute used as cache. The
+#:  AST does not change once decompiled, so this allows to create the
+#:  :class:`CNode` for the children only once. This is used by
+#:  :func:`buildCNode`.
+#:
+#:  As the children keep a reference on their parent, a node which has
+#:  cached its children is part of a reference cycle: a tree of
+#:  :class:`CNode` is freed by the garbage collector of python and not
+#:  directly when the last reference on it is dropped. This is the price
+#:  for not creating again the children at each access.
+_cnodeCachedChildren = {
+        "ops": "_ops_cache",
+        "stmt_children": "_stmt_children_cache",
+        "expr_children": "_expr_children_cache",
+    }
+
+def _cached_children_property(prop, cache_name):
+    """
+        Internal function which create a property caching the list returned
+        by another property. The list is computed the first time and a copy
+        of it is returned each time.
+
+        :param prop: The property object for which to cache the result.
+        :param str cache_name: The name of the attribute to use for storing
+            the list, ``None`` if it has not been computed yet.
+        :return: A new property object.
+    """
+    fget = prop.fget
+    def _get_cached(self):
+        l = getattr(self, cache_name)
+        if l is None:
+            l = fget(self)
+            setattr(self, cache_name, l)
+        return list(l)
+    return property(_get_cached, doc=prop.__doc__)
+
+#: Template for the ``ops`` property generated by :func:`_gen_ops_property`.
+#:  ``{childs}`` is replaced by the code getting the :class:`CNode` for each
+#:  field (using ``_genOpsChildTemplate``) and ``{names}`` by the names of
+#:  the variables containing them.
+_genOpsTemplate = """
+def ops(self):
+    l = self._ops_cache
+    if l is None:
+        c = self._cexpr
+        f = self._hxcfunc
+        w = f._wrap_cache
+{childs}
+        l = [{names}]
+        self._ops_cache = l
+    return list(l)
+"""
+
+#: Template for getting the :class:`CNode` of one field in the code
+#:  generated by :func:`_gen_ops_property`. ``{c}`` is the variable for the
+#:  ``citem_t``, ``{n}`` the one for the :class:`CNode` and ``{field}`` the
+#:  name of the field. The test against ``None`` must be explicit: a
+#:  :class:`CNode` can be false.
+_genOpsChildTemplate = """
+        {c} = c.{field}
+        {n} = w.get({c}.obj_id)
+        if {n} is None:
+            cl = _op2cnode.get({c}.op)
+            if cl is None:
+                {n} = _from_citem({c}, f, self)
+            else:
+                {n} = cl({c}, f, self)"""
+
+def _gen_ops_property(fields, doc=None):
+    """
+        Internal function which generate the ``ops`` property of a
+        :class:`CNodeExpr` for which the operands are fixed fields of the
+        ``cexpr_t`` (see ``HxCExpr._ops_fields``). The generated code access
+        directly the fields and ``_op2cnode`` without any loop or call to
+        other methods of the object, the result is cached as for
+        :func:`_cached_children_property` .
+
+        :param fields: A tuple of the names of the fields of the ``cexpr_t``
+            which are the operands.
+        :param doc: The documentation for the property.
+        :return: A property object.
+    """
+    names = ["n{}".format(i) for i in range(len(fields))]
+    src = _genOpsTemplate.format(
+            childs="".join(_genOpsChildTemplate.format(c="c{}".format(i), n=n, field=fi) for i, (n, fi) in enumerate(zip(names, fields))),
+            names=", ".join(names))
+    ns = {"_op2cnode": _op2cnode, "_from_citem": CNode.from_citem}
+    exec(src, ns)
+    return property(ns["ops"], doc=doc)
+
 def buildCNode(cls):
     """
         Class decorator for automatically building a class equivalent to the
@@ -613,7 +972,15 @@ def buildCNode(cls):
           in ``_citem2cnode`` .
         * create a class identicall to the one in arguments but with name
           change for being prefix by ``CNode`` instead of ``HxC``. Attributes
-          of the class are copied into the new class.
+          of the class are copied into the new class, the new class define
+          an empty ``__slots__`` (it does not have a ``__dict__``). The class
+          is created using the :class:`_CNodeMeta` metaclass which add the
+          methods registered with :func:`addCNodeMethod` .
+        * the properties listed in ``_cnodeCachedChildren`` are replaced by
+          properties caching their result in the object.
+        * if the class define ``_ops_fields`` and the ``ops`` property, the
+          ``ops`` property is replaced by one generated by
+          :func:`_gen_ops_property` .
         * set the new class created as global to this module (the cnode one,
           not the one it was used in).
     """
@@ -633,17 +1000,27 @@ def buildCNode(cls):
     attr = dict(cls.__dict__) # create a copy of the dict
     attr["__module__"] = __name__ # change module to cnode
     attr["__doc__"] = "Copy of :class:`{}` but which inherit from :class:`CNode`.\nAutomatically created by :func:`~bip.hexrays.cnode.buildCNode`".format(cls.__name__)# change doc
+    # the HxCItem class may have a __dict__, the CNode one only use the slots
+    #   of its bases: remove the descriptors and define empty slots.
+    attr.pop("__dict__", None)
+    attr.pop("__weakref__", None)
+    attr["__slots__"] = ()
 
     # getting the name of the new class
     cn_cls_nm = cls.__name__.replace("HxC", "CNode")
 
-    # adding methods from _cnodeMethods if any
-    if cn_cls_nm in _cnodeMethods:
-        for na, f in _cnodeMethods[cn_cls_nm]:
-            attr[na] = f
+    # caching the children created
+    for na, cache_name in _cnodeCachedChildren.items():
+        if na in attr and isinstance(attr[na], property):
+            attr[na] = _cached_children_property(attr[na], cache_name)
 
-    # creating the new class
-    cn_cls = type(
+    # specialized ops if the operands are known
+    if attr.get("_ops_fields") is not None and "ops" in attr:
+        attr["ops"] = _gen_ops_property(attr["_ops_fields"], attr["ops"].__doc__)
+
+    # creating the new class, the methods from _cnodeMethods are added by
+    #   the metaclass
+    cn_cls = _CNodeMeta(
             cn_cls_nm, # change name
             tuple(lb), # bases classes
             attr
@@ -655,6 +1032,11 @@ def buildCNode(cls):
     # adding it to _citem2cnode
     _citem2cnode[cls] = cn_cls
 
+    # adding the types it handles to _op2cnode
+    _register_op2cnode(cn_cls)
+    # the expanded filters may be missing the new class
+    _expanded_filters.clear()
+
     # return the old class we don't want to change it
     return cls
 
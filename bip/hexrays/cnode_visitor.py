@@ -37,22 +37,20 @@ def visit_dfs_cnode(cnode, callback):
     """
     # implem using a stack for avoiding recursivity problems
     # this is a tree so no need to check if we have already treated a node.
+    CNodeExpr = bip.hexrays.cnode.CNodeExpr
+    CNodeStmt = bip.hexrays.cnode.CNodeStmt
     stack = [cnode]
-    while len(stack) != 0:
+    while stack:
         elt = stack.pop() # get the next element
         if callback(elt) == False: # call the callback before visiting the next
             return # if ret False: stop
-        if isinstance(elt, bip.hexrays.cnode.CNodeExpr):
-            # if we have an expr just append all the child, we append them
-            #   in reverse order.
-            ch = list(elt.ops)
-            ch.reverse()
-            stack += ch
-        elif isinstance(elt, bip.hexrays.cnode.CNodeStmt):
-            ch = list(elt.expr_children)
-            ch += list(elt.stmt_children)
-            ch.reverse()
-            stack += ch
+        # the childs are appended in reverse order for being pop in the
+        #   correct one.
+        if isinstance(elt, CNodeExpr):
+            stack.extend(reversed(elt.ops))
+        elif isinstance(elt, CNodeStmt):
+            stack.extend(reversed(elt.stmt_children))
+            stack.extend(reversed(elt.expr_children))
         else:
             # this should never happen
             raise RuntimeError("Unknown type for visiting: {}".format(elt))
@@ -84,40 +82,116 @@ def visit_dfs_cnode_filterlist(cnode, callback, filter_list):
     if isinstance(filter_list, (list, tuple)) and len(filter_list) == 0:
         # we don't visit anything
         return
+    CNodeExpr = bip.hexrays.cnode.CNodeExpr
+    CNodeStmt = bip.hexrays.cnode.CNodeStmt
+    # a list is a match on the exact class, everything else is for isinstance
+    is_list = isinstance(filter_list, list)
+    if isinstance(filter_list, (list, tuple)):
+        flt = tuple(filter_list)
+    else:
+        flt = (filter_list, )
+    # set of the classes matching, None if isinstance should be used
+    expanded = bip.hexrays.cnode._expand_filter(filter_list)
     # check if we need to visit the child of the expression
     vist_expr = False
-    if isinstance(filter_list, (list, tuple)):
-        for i in filter_list:
-            if issubclass(i, bip.hexrays.cnode.CNodeExpr):
-                vist_expr = True
-                break
-    elif issubclass(filter_list, bip.hexrays.cnode.CNodeExpr):
-        vist_expr = True
+    for i in flt:
+        if issubclass(i, CNodeExpr):
+            vist_expr = True
+            break
     stack = [cnode]
-    while len(stack) != 0:
+    while stack:
         elt = stack.pop() # get the next element
         # check if we want the call
-        if ((isinstance(filter_list, list) and elt.__class__ in filter_list) or
-            (not isinstance(filter_list, list)
-                and isinstance(elt, filter_list))):
+        if expanded is not None:
+            match = elt.__class__ in expanded
+        elif is_list:
+            match = elt.__class__ in flt
+        else:
+            match = isinstance(elt, flt)
+        if match:
             # check if we want the call
             if callback(elt) == False: # call the callback before visiting the next
                 return
-        if isinstance(elt, bip.hexrays.cnode.CNodeExpr):
+        if isinstance(elt, CNodeExpr):
             if vist_expr:
-                ch = list(elt.ops)
-                ch.reverse()
-                stack += ch
-        elif isinstance(elt, bip.hexrays.cnode.CNodeStmt):
+                stack.extend(reversed(elt.ops))
+        elif isinstance(elt, CNodeStmt):
+            stack.extend(reversed(elt.stmt_children))
             if vist_expr:
-                ch = list(elt.expr_children)
-            else:
-                ch = []
-            ch += list(elt.stmt_children)
-            ch.reverse()
-            stack += ch
+                stack.extend(reversed(elt.expr_children))
         else:
             # this should never happen
             raise RuntimeError("Unknown type for visiting: {}".format(elt))
 
+def _dfs_filter_soa(ops, first_child, next_sibling, root, op_mask):
+    """
+        Internal visitor working on the arrays created by
+        :meth:`~HxCFunc.build_node_soa` instead of :class:`CNode` objects.
+        This visits the nodes in the same order as :func:`visit_dfs_cnode`
+        and return the indexes of the nodes for which the type is in
+        ``op_mask``. :func:`_get_dfs_filter_soa` should be used for getting
+        the compiled version of this function.
 
+        :param ops: Array of the :class:`HxCType` of each node.
+        :param first_child: Array of the index of the first child of each
+            node, ``-1`` if the node has no child.
+        :param next_sibling: Array of the index of the next child of the
+            parent of each node, ``-1`` for the last child.
+        :param int root: Index of the node from which to start the visit.
+        :param op_mask: Array of boolean indexed by :class:`HxCType`, a node
+            is returned if its type is ``True`` in this array.
+        :return: An array of ``int32`` containing the indexes of the nodes
+            matching, in the order of the visit.
+    """
+    # copy of ops for getting arrays of the same size and type without
+    #   depending on numpy here, the content is overwritten.
+    res = ops.copy()
+    nb_res = 0
+    # each node is pushed only once, the stack can not be bigger
+    stack = ops.copy()
+    stack[0] = root
+    sp = 1
+    while sp > 0:
+        sp -= 1
+        i = stack[sp]
+        if op_mask[ops[i]]:
+            res[nb_res] = i
+            nb_res += 1
+        # push the childs and then reverse them for popping the first one
+        start = sp
+        ch = first_child[i]
+        while ch != -1:
+            stack[sp] = ch
+            sp += 1
+            ch = next_sibling[ch]
+        a = start
+        b = sp - 1
+        while a < b:
+            tmp = stack[a]
+            stack[a] = stack[b]
+            stack[b] = tmp
+            a += 1
+            b -= 1
+    return res[:nb_res]
+
+#: Version of :func:`_dfs_filter_soa` to use, compiled if numba is
+#:  available. ``None`` as long as :func:`_get_dfs_filter_soa` has not been
+#:  called.
+_dfs_filter_soa_func = None
+
+def _get_dfs_filter_soa():
+    """
+        Internal function which return the function to use for visiting the
+        arrays created by :meth:`~HxCFunc.build_node_soa`. This is
+        :func:`_dfs_filter_soa` compiled using ``numba`` if it is available
+        (numba is imported and the function compiled only at the first
+        call), or :func:`_dfs_filter_soa` itself if not.
+    """
+    global _dfs_filter_soa_func
+    if _dfs_filter_soa_func is None:
+        try:
+            import numba
+            _dfs_filter_soa_func = numba.njit(cache=True)(_dfs_filter_soa)
+        except ImportError:
+            _dfs_filter_soa_func = _dfs_filter_soa
+    return _dfs_filter_soa_func
@@ -245,6 +245,7 @@ class HxCExprTernary(HxCExpr):
         This class contain 3 operands which are recursive.
     """
     TYPE_HANDLE = HxCType.COT_TERN
+    _ops_fields = ("x", "y", "z")
 
     @property
     def cond(self):
@@ -280,7 +281,7 @@ class HxCExprTernary(HxCExpr):
 
     @property
     def ops(self):
-        return [self.cond, self.expr1, self.expr2]
+        return self._create_children((self._cexpr.x, self._cexpr.y, self._cexpr.z))
 
 @cnode.buildCNode
 class HxCExprDoubleOperation(HxCExpr):
@@ -288,6 +289,7 @@ class HxCExprDoubleOperation(HxCExpr):
         Abstract class for representing a :class:`HxCExpr` with two operands.
         Those operands are also :class:`HxCExpr` making them recursive.
     """
+    _ops_fields = ("x", "y")
 
     @property
     def first_op(self):
@@ -311,7 +313,7 @@ class HxCExprDoubleOperation(HxCExpr):
 
     @property
     def ops(self):
-        return [self.first_op, self.second_op]
+        return self._create_children((self._cexpr.x, self._cexpr.y))
 
 @cnode.buildCNode
 class HxCExprComma(HxCExprDoubleOperation):
@@ -769,6 +771,7 @@ class HxCExprUnaryOperation(HxCExpr):
         This :meth:`HxCExprUnaryOperation.operand` is also a :class:`HxCExpr`
         making it recursive.
     """
+    _ops_fields = ("x", )
 
     @property
     def operand(self):
@@ -1022,7 +1025,7 @@ class HxCExprCall(HxCExpr):
 
             :return: A list of :class:`HxCExpr` .
         """
-        return [self._create_child(i) for i in self._carglist]
+        return self._create_children(self._carglist)
 
     @property
     def args_iter(self):
@@ -1036,7 +1039,7 @@ class HxCExprCall(HxCExpr):
 
     @property
     def ops(self):
-        return [self.caller] + self.args
+        return self._create_children([self._cexpr.x] + list(self._carglist))
 
 @cnode.buildCNode
 class HxCExprMemAccess(HxCExpr):
@@ -1079,6 +1082,7 @@ class HxCExprIdx(HxCExprMemAccess):
         representing the index which is access.
     """
     TYPE_HANDLE = HxCType.COT_IDX
+    _ops_fields = ("x", "y")
 
     @property
     def array(self):
@@ -1112,7 +1116,7 @@ class HxCExprIdx(HxCExprMemAccess):
 
     @property
     def ops(self):
-        return [self.array, self.index]
+        return self._create_children((self._cexpr.x, self._cexpr.y))
 
 
 @cnode.buildCNode
@@ -1124,6 +1128,7 @@ class HxCExprMemref(HxCExprMemAccess):
         representing the memory offset.
     """
     TYPE_HANDLE = HxCType.COT_MEMREF
+    _ops_fields = ("x", )
 
     @property
     def mem(self):
@@ -1166,6 +1171,7 @@ class HxCExprMemptr(HxCExprMemAccess):
         access by this expression.
     """
     TYPE_HANDLE = HxCType.COT_MEMPTR
+    _ops_fields = ("x", )
 
     @property
     def ptr(self):
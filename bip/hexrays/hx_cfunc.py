@@ -1,12 +1,14 @@
 import ida_hexrays
 import ida_kernwin
+import weakref
 
 from .hx_lvar import HxLvar
 from .hx_visitor import _hx_visitor_expr, _hx_visitor_list_expr, _hx_visitor_stmt, _hx_visitor_list_stmt, _hx_visitor_all, _hx_visitor_list_all
-from .cnode import CNode
+from .cnode import CNode, _op2cnode, _expand_filter
 from .hx_citem import HxCItem
 #from cnode_visitor import visit_dfs_cnode, visit_dfs_cnode_filterlist
 import bip.base as bbase
+from .astnode import HxCType
 
 class HxCFunc(object):
     """
@@ -35,6 +37,32 @@ class HxCFunc(object):
                 by ``ida_hexrays.decompile`` .
         """
         self._cfunc = cfunc
+        #: Cache for the results of :meth:`CNode.get_cnode_filter_type`. The
+        #:  key is a tuple containing the ``obj_id`` of the ``citem_t`` from
+        #:  which the visit start and the filter used, the value is the list
+        #:  of :class:`CNode` found. This is private and is emptied by
+        #:  :meth:`~HxCFunc.invalidate_cache`.
+        self._filter_cache = {}
+        #: Dictionary of the :class:`CNode` created for this function, the
+        #:  key is the ``obj_id`` of their ``citem_t``. This allows to
+        #:  create only one :class:`CNode` for each ``citem_t`` (see
+        #:  :meth:`CNode.from_citem`). The values are weak references: the
+        #:  :class:`CNode` are kept alive only as long as they are used (a
+        #:  node keeps its parent alive), this object does not own them.
+        #:  This is private.
+        self._wrap_cache = weakref.WeakValueDictionary()
+        #: Arrays representing the AST of this function, created by
+        #:  :meth:`~HxCFunc.build_node_soa`. ``None`` if they were not
+        #:  created. This is private.
+        self._node_soa = None
+        #: List of the :class:`CNode` of the function in the order of the
+        #:  arrays of ``_node_soa``, ``None`` if those were not created. This
+        #:  keeps all the nodes of the function alive until
+        #:  :meth:`~HxCFunc.invalidate_cache` is called.
+        self._soa_nodes = None
+        #: Dictionary of ``obj_id`` of ``citem_t`` to their index in the
+        #:  arrays of ``_node_soa``, ``None`` if those were not created.
+        self._soa_index = None
 
     @property
     def ea(self):
@@ -82,9 +110,20 @@ class HxCFunc(object):
                 :class:`HxCFunc` warning for more information about this
                 potential problem.
 
+            This also empties the caches of this object which keep
+            :class:`CNode` alive: the results of
+            :meth:`CNode.get_cnode_filter_type` and the nodes of
+            :meth:`~HxCFunc.build_node_soa`. Once no longer referenced
+            elsewhere, those nodes are freed and removed from the weak
+            ``_wrap_cache``.
+
             :param close_window: If true the window(s) showing the
                 disassembled function will be closed. False by default.
         """
+        self._filter_cache.clear()
+        self._node_soa = None
+        self._soa_nodes = None
+        self._soa_index = None
         ida_hexrays.mark_cfunc_dirty(self.ea, close_window)
 
     ################################ CMT ###########################
@@ -284,6 +323,108 @@ class HxCFunc(object):
         """
         return self.root_node.get_cnode_filter_type(type_filter)
 
+    def multi_filter(self, buckets):
+        """
+            Method which return several lists of :class:`CNode` of particular
+            types while visiting the function only once. This should be
+            prefered to several calls to :meth:`~HxCFunc.get_cnode_filter_type`
+            when different types of nodes are needed. This is just a wrapper
+            on :meth:`CNode.multi_filter`, see it for more information.
+
+            :param buckets: A dictionary with the name of the result as key
+                and the filter as value.
+            :return: A dictionary with the same keys as ``buckets`` and as
+                value the list of :class:`CNode` matching the filter.
+        """
+        return self.root_node.multi_filter(buckets)
+
+    def build_node_soa(self):
+        """
+            Create a representation of the AST of this function as arrays:
+            each node has an index, in the order in which they are visited by
+            :meth:`~HxCFunc.visit_cnode`, and each array contains one
+            information for all the nodes. This require ``numpy``.
+
+            Once created, :meth:`~CNode.get_cnode_filter_type` use those
+            arrays for searching the nodes instead of visiting the
+            :class:`CNode`. If ``numba`` is installed the search is compiled,
+            this is interesting when making a lot of search in the same
+            function. Arrays are created only once, calling this method again
+            return the same arrays, :meth:`~HxCFunc.invalidate_cache` delete
+            them.
+
+            :raise ImportError: If numpy is not available.
+            :return: A tuple of 4 ``numpy.ndarray`` of ``int32`` with the
+                :class:`HxCType` of each node, the index of the parent of
+                each node (``-1`` for the root), the index of the first
+                child of each node (``-1`` if none) and the index of the next
+                sibling of each node (``-1`` if none).
+        """
+        if self._node_soa is not None:
+            return self._node_soa
+        try:
+            import numpy # lazy import, optional
+        except ImportError:
+            raise ImportError("numpy is not available, it is necessary for build_node_soa")
+        nodes = []
+        self.visit_cnode(nodes.append)
+        nb = len(nodes)
+        ops = numpy.empty(nb, dtype=numpy.int32)
+        parent = numpy.full(nb, -1, dtype=numpy.int32)
+        first_child = numpy.full(nb, -1, dtype=numpy.int32)
+        next_sibling = numpy.full(nb, -1, dtype=numpy.int32)
+        last_child = numpy.full(nb, -1, dtype=numpy.int32)
+        # node objects are all alive in nodes, their id are unique
+        idx_by_id = {}
+        for i, cn in enumerate(nodes):
+            idx_by_id[id(cn)] = i
+            ops[i] = cn._ctype
+            if cn._parent is None:
+                continue
+            # the visit is a DFS: the parent was already seen, and the
+            #   childs are seen in order.
+            p = idx_by_id[id(cn._parent)]
+            parent[i] = p
+            if first_child[p] == -1:
+                first_child[p] = i
+            else:
+                next_sibling[last_child[p]] = i
+            last_child[p] = i
+        self._soa_nodes = nodes
+        self._soa_index = dict((cn._citem.obj_id, i) for i, cn in enumerate(nodes))
+        self._node_soa = (ops, parent, first_child, next_sibling)
+        return self._node_soa
+
+    def _soa_filter_type(self, cnode, type_filter):
+        """
+            Internal method which search the nodes matching a filter below a
+            :class:`CNode` using the arrays created by
+            :meth:`~HxCFunc.build_node_soa`. This is used by
+            :meth:`CNode.get_cnode_filter_type`.
+
+            :param cnode: The :class:`CNode` from which to start the search.
+            :param type_filter: The filter as used by
+                :meth:`CNode.get_cnode_filter_type`.
+            :return: A list of :class:`CNode` which match the filter, or
+                ``None`` if the arrays can not be used (not created, or
+                filter not supported).
+        """
+        if self._node_soa is None:
+            return None
+        root = self._soa_index.get(cnode._citem.obj_id)
+        expanded = _expand_filter(type_filter)
+        if root is None or expanded is None:
+            return None
+        import numpy # lazy import, already checked by build_node_soa
+        from .cnode_visitor import _get_dfs_filter_soa
+        op_mask = numpy.zeros(HxCType.CIT_END, dtype=numpy.bool_)
+        for op, cl in _op2cnode.items():
+            if cl in expanded:
+                op_mask[op] = True
+        ops, parent, first_child, next_sibling = self._node_soa
+        res = _get_dfs_filter_soa()(ops, first_child, next_sibling, root, op_mask)
+        return [self._soa_nodes[i] for i in res]
+
     def get_cnode_label(self, label_num):
         """
             Method which return the :class:`CNode` which represents the start
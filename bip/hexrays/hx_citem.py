@@ -23,6 +23,8 @@ class HxCItem(AbstractCItem):
     #:  :class:`HxCType` they handle.
     TYPE_HANDLE = -1
 
+    __slots__ = ()
+
     ############################ ITEM CREATION ##############################
 
     def _create_child(self, citem):
@@ -41,6 +43,17 @@ class HxCItem(AbstractCItem):
         """
         return HxCItem.from_citem(citem)
 
+    def _create_children(self, citems):
+        """
+            Internal method which allow to create a list of :class:`HxCItem`
+            objects from an iterable of ``citem_t``. This is the equivalent
+            of calling :meth:`~HxCItem._create_child` on each element.
+
+            :param citems: An iterable of ``citem_t`` from ida.
+            :return: A list of objects which inherit from :class:`HxCItem` .
+        """
+        return [HxCItem.from_citem(citem) for citem in citems]
+
     @staticmethod
     def from_citem(citem):
         """
@@ -62,17 +75,15 @@ class HxCItem(AbstractCItem):
             :return: The equivalent object to the ``citem_t`` for bip. This
                 will be an object which inherit from :class:`HxCItem` .
         """
-        done = set()
-        todo = set(HxCItem.__subclasses__())
-        while len(todo) != 0:
+        # the hierarchy of HxCItem is a tree, a class can not be found
+        #   twice: no need to keep track of the class already done.
+        op = citem.op
+        todo = HxCItem.__subclasses__()
+        while todo:
             cl = todo.pop()
-            if cl in done:
-                continue
-            if cl.is_handling_type(citem.op):
+            if cl.is_handling_type(op):
                 return cl(citem)
-            else:
-                done.add(cl)
-                todo |= set(cl.__subclasses__())
+            todo.extend(cl.__subclasses__())
         raise ValueError("from_citem could not find an object matching the citem_t type provided ({})".format(citem.op))
 
 class HxCExpr(HxCItem):
@@ -89,6 +100,15 @@ class HxCExpr(HxCItem):
         used.
     """
 
+    __slots__ = ("_cexpr",)
+
+    #: Names of the fields of the ``cexpr_t`` which are the operands of
+    #:  this expression, in the same order as :meth:`~HxCExpr.ops`. ``None``
+    #:  if the operands are not fixed fields. This is used by
+    #:  :func:`~bip.hexrays.cnode.buildCNode` for generating a specialized
+    #:  ``ops`` property for the :class:`CNode` equivalent.
+    _ops_fields = None
+
     def __init__(self, cexpr):
         """
             Constructor for a :class:`HxCExpr` object.
@@ -147,6 +167,8 @@ class HxCStmt(HxCItem):
         object will start with the prefix ``stmt_`` or ``st_``.
     """
 
+    __slots__ = ("_cinsn",)
+
     def __init__(self, cinsn):
         """
             Constructor for a :class:`HxCStmt` object.
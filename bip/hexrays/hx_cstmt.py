@@ -330,7 +330,7 @@ class HxCStmtFor(HxCStmtLoop):
 
     @property
     def expr_children(self):
-        return [self.init, self.cond, self.step]
+        return self._create_children((self._cinsn.cfor.init, self._cinsn.cfor.expr, self._cinsn.cfor.step))
 
 @cnode.buildCNode
 class HxCStmtWhile(HxCStmtLoop):
@@ -469,7 +469,7 @@ class HxCStmtSwitch(HxCStmt):
                 cases of this switch.
             :rtype: Objects which inherit from :class:`HxCStmt` .
         """
-        return [self._create_child(i) for i in self._cinsn.cswitch.cases]
+        return self._create_children(self._cinsn.cswitch.cases)
 
     @property
     def cases_val(self):
@@ -532,7 +532,7 @@ class HxCStmtBlock(HxCStmt):
             :return: The list of child statement of this block.
             :rtype: Objects which inherit from :class:`HxCStmt` .
         """
-        return [self._create_child(e) for e in self._cinsn.cblock]
+        return self._create_children(self._cinsn.cblock)
 
     @property
     def stmt_children(self):
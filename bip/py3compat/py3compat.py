@@ -37,4 +37,28 @@ else:
         """
         return chr(i)
 
+def with_metaclass(meta, *bases):
+    """
+        Function for creating a class with a metaclass in a way compatible
+        with python2 (``__metaclass__``) and python3 (``metaclass=``). The
+        result should be used as the only base class:
+
+        .. code-block:: python
+
+            class MyClass(with_metaclass(MyMeta, MyBase)):
+                pass
+
+        This is the same trick as the one used by ``six``: a temporary
+        class is created, its metaclass replace itself by ``meta`` when the
+        real class is created.
+
+        :param meta: The metaclass to use.
+        :param bases: The base classes of the class.
+        :return: A temporary class to use as base class.
+    """
+    class metaclass(type):
+        def __new__(mcs, name, this_bases, d):
+            return meta(name, bases, d)
+    return type.__new__(metaclass, "temporary_class", (), {})
+
 
@@ -43,7 +43,7 @@ def test_bipabstractcitem00():
     assert aci.is_statement == True
     assert aci._ctype == HxCType.CIT_BLOCK
     # equality
-    assert id(aci) != id(hxf.root_node)
+    assert aci is hxf.root_node # only one CNode by citem in a function
     assert aci == hxf.root_node
     assert aci != hxf.root_node.stmt_children[0]
     assert aci.__eq__(0x10) == NotImplemented
@@ -78,6 +78,10 @@ def test_bipcnode00():
     with pytest.raises(RuntimeError): cn.parent
     assert cnc.parent == cn
     assert cn.hxcfunc == hxf
+    # only one CNode by citem in a function
+    assert hxf.root_node is cn
+    assert cn.stmt_children[0] is cnc
+    assert cnc.parent is cn
     # comment
     assert cna.comment is None
     cna.comment = "cmt4test"
@@ -152,7 +156,53 @@ def test_bipcnodevisitor00():
     assert isinstance(ln, list)
     assert len(ln) == 1
     assert isinstance(ln[0], CNodeExprHelper)
+    # second call use the cache of the HxCFunc
+    ln2 = hxf.get_cnode_filter_type([CNodeExprHelper])
+    assert ln2 == ln
+    assert ln2 is not ln
+    hxf.invalidate_cache()
+    assert hxf.get_cnode_filter_type([CNodeExprHelper]) == ln
+    # several filters in one visit
+    d = hxf.multi_filter({"helper": [CNodeExprHelper], "call": CNodeExprCall})
+    assert isinstance(d, dict)
+    assert d["helper"] == ln
+    assert d["call"] == hxf.get_cnode_filter_type(CNodeExprCall)
     hxf = HxCFunc.from_addr(0x018009BF50)
     hxf.visit_cnode(genst_all)
 
-
+def test_bipcnodesoa00():
+    # arrays representation of the AST, optional as this require numpy
+    numpy = pytest.importorskip("numpy")
+    from bip.hexrays.cnode_visitor import _dfs_filter_soa
+    hxf = HxCFunc.from_addr(0x0180078F20)
+    flt = [CNodeExprCall, CNodeExprHelper]
+    lv = []
+    hxf.visit_cnode_filterlist(lv.append, flt)
+    ops, parent, first_child, next_sibling = hxf.build_node_soa()
+    assert hxf.build_node_soa()[0] is ops # created only once
+    nodes = []
+    hxf.visit_cnode(nodes.append)
+    assert len(ops) == len(nodes)
+    assert parent[0] == -1
+    assert ops[0] == HxCType.CIT_BLOCK
+    # get_cnode_filter_type use the arrays, same objects in the same order
+    ln = hxf.get_cnode_filter_type(flt)
+    assert len(ln) == len(lv)
+    for cna, cnv in zip(ln, lv):
+        assert cna is cnv
+    # direct visit on the arrays
+    op_mask = numpy.zeros(HxCType.CIT_END, dtype=numpy.bool_)
+    for cn in lv:
+        op_mask[cn._ctype] = True
+    res = _dfs_filter_soa(ops, first_child, next_sibling, 0, op_mask)
+    assert [nodes[i] for i in res] == lv
+    # from a node which is not the root, isinstance filter
+    cn = hxf.root_node.stmt_children[0]
+    lv = []
+    cn.visit_cnode_filterlist(lv.append, (CNodeExpr, ))
+    ln = cn.get_cnode_filter_type((CNodeExpr, ))
+    assert len(ln) == len(lv)
+    for cna, cnv in zip(ln, lv):
+        assert cna is cnv
+    hxf.invalidate_cache()
+    assert hxf._node_soa is None